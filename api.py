@@ -1,16 +1,108 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import Optional, List, Tuple, Union
+import asyncio
+import os
 import uvicorn
 
-# Import the translation function from main.py
-from main import translate, TranslationOutput
+# Import the translation functions from main.py
+from main import MAX_BATCH_SIZE, load_model, generate_translations, parse_translation, TranslationOutput, TranslationModel, VLLMTranslationModel
+from schemas import (
+    TranslationRequest,
+    TranslationResponse,
+    BatchTranslationRequest,
+    BatchTranslationResult,
+    BatchTranslationResponse,
+)
+
+# Dynamic batching: concurrent requests arriving within BATCH_TIMEOUT_MS of each
+# other are coalesced into one model.generate call of up to MAX_BATCH_SIZE (main.py) prompts.
+BATCH_TIMEOUT_MS = 20
+
+class TranslationBatcher:
+    """Collects queued translation requests and runs them through the model in batches"""
+    def __init__(self, llm: Union[TranslationModel, VLLMTranslationModel], max_batch_size: int = MAX_BATCH_SIZE, timeout_ms: int = BATCH_TIMEOUT_MS):
+        self.llm = llm
+        self.max_batch_size = max_batch_size
+        self.timeout = timeout_ms / 1000
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, text: str, src_lang: str, tgt_lang: str) -> TranslationOutput:
+        """Queue a translation and wait for the batch containing it to finish"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put(((text, src_lang, tgt_lang), future))
+        return await future
+
+    async def collect(self) -> List[Tuple[Tuple[str, str, str], asyncio.Future]]:
+        """Wait for one request, then gather more until the batch is full or the window closes"""
+        entries = [await self.queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.timeout
+
+        while len(entries) < self.max_batch_size:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                entries.append(await asyncio.wait_for(self.queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return entries
+
+    async def run(self):
+        while True:
+            entries = await self.collect()
+            batch = [item for item, _ in entries]
+
+            # Run the blocking GPU call in a worker thread so the event loop keeps
+            # accepting (and queueing) requests while a batch is generating.
+            # Only this task calls the model, so generation stays serialized.
+            try:
+                raw_outputs = await asyncio.to_thread(generate_translations, self.llm, batch)
+            except Exception as e:
+                for _, future in entries:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            # Parse each output separately so one malformed response doesn't fail the whole batch
+            for (_, future), raw in zip(entries, raw_outputs):
+                if future.done():
+                    continue
+                try:
+                    future.set_result(parse_translation(raw))
+                except Exception as e:
+                    future.set_exception(e)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the model once per server process when it starts serving, not at import time
+    app.state.batcher = TranslationBatcher(load_model())
+    app.state.batcher.start()
+    yield
+    await app.state.batcher.stop()
+
+def get_batcher(request: Request) -> TranslationBatcher:
+    return request.app.state.batcher
 
 app = FastAPI(
     title="Translation API",
     description="API for translating text between languages using SD-15 MT Model",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS - Allow all origins for public API
@@ -22,23 +114,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-class TranslationRequest(BaseModel):
-    text: str
-    source_language: str
-    target_language: str
-
-class TranslationResponse(BaseModel):
-    original_text: str
-    translated_text: str
-    source_language: str
-    target_language: str
-
 @app.get("/")
 async def root():
     return {
         "message": "Translation API is running",
         "endpoints": {
             "translate": "/translate (POST)",
+            "translate_batch": "/translate_batch (POST)",
             "health": "/health (GET)"
         }
     }
@@ -48,7 +130,7 @@ async def health():
     return {"status": "healthy"}
 
 @app.post("/translate", response_model=TranslationResponse)
-async def translate_text(request: TranslationRequest):
+async def translate_text(request: TranslationRequest, batcher: TranslationBatcher = Depends(get_batcher)):
     """
     Translate text from source language to target language.
 
@@ -64,8 +146,8 @@ async def translate_text(request: TranslationRequest):
         if not request.text.strip():
             raise HTTPException(status_code=400, detail="Text cannot be empty")
 
-        # Call the translation function
-        result = translate(
+        # Queue the request; the batcher runs it alongside any concurrent requests
+        result = await batcher.submit(
             text=request.text,
             src_lang=request.source_language,
             tgt_lang=request.target_language
@@ -83,5 +165,55 @@ async def translate_text(request: TranslationRequest):
             detail=f"Translation failed: {str(e)}"
         )
 
+@app.post("/translate_batch", response_model=BatchTranslationResponse)
+async def translate_batch(request: BatchTranslationRequest, batcher: TranslationBatcher = Depends(get_batcher)):
+    """
+    Translate several texts in one request.
+
+    Args:
+        items: List of translation requests (text, source_language, target_language)
+
+    Returns:
+        BatchTranslationResponse with one result per item, in order. Items whose
+        translation failed have an empty translated_text and an error message.
+    """
+    if any(not item.text.strip() for item in request.items):
+        raise HTTPException(status_code=400, detail="Text cannot be empty")
+
+    # Queue every item at once so they share GPU batches with each other and any concurrent requests
+    results = await asyncio.gather(
+        *[
+            batcher.submit(
+                text=item.text,
+                src_lang=item.source_language,
+                tgt_lang=item.target_language
+            )
+            for item in request.items
+        ],
+        return_exceptions=True
+    )
+
+    items = []
+    for item, result in zip(request.items, results):
+        if isinstance(result, Exception):
+            items.append(BatchTranslationResult(
+                original_text=item.text,
+                translated_text="",
+                source_language=item.source_language,
+                target_language=item.target_language,
+                error=f"Translation failed: {str(result)}"
+            ))
+        else:
+            items.append(BatchTranslationResult(
+                original_text=result.original_text,
+                translated_text=result.translated_text,
+                source_language=item.source_language,
+                target_language=item.target_language
+            ))
+
+    return BatchTranslationResponse(items=items)
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=9000)
+    # Must stay a single process: each worker would load its own copy of the model.
+    # Scale request handling with gateway.py instead.
+    uvicorn.run(app, host="0.0.0.0", port=int(os.environ.get("PORT", 9000)))
@@ -9,28 +9,34 @@ This script calculates BLEU scores for the translation API by:
 4. Computing aggregate BLEU scores and statistics
 
 Usage:
-    python calculate_bleu.py [--api-url URL] [--limit N] [--no-api]
+    python calculate_bleu.py [--api-url URL] [--batch-api-url URL] [--batch-size N] [--limit N] [--concurrency N] [--sentence-bleu] [--gpu-bleu] [--no-api]
 
     --api-url: API endpoint (default: http://localhost:9000/translate)
+    --batch-api-url: Batch API endpoint (default: --api-url with a _batch suffix)
+    --batch-size: Samples per batch request; 1 sends one request per sample (default: 32)
     --limit: Number of samples to test (default: all)
+    --concurrency: Maximum in-flight API requests (default: 32)
+    --sentence-bleu: Also compute sentence-level BLEU statistics (default: corpus BLEU only)
+    --gpu-bleu: Count BLEU statistics on the GPU with torch (default: CPU)
     --no-api: Calculate BLEU between existing translations only (for testing)
 """
 
-import json
+import orjson
 import argparse
+import asyncio
 from pathlib import Path
-from typing import List, Dict, Tuple
-import requests
+from typing import List, Dict, Tuple, Optional
+import httpx
 from sacrebleu import BLEU
-from statistics import mean, stdev
+import numpy as np
 import time
 
 
 def load_test_data(filepath: str, limit: int = None) -> List[Dict]:
     """Load test data from JSON file."""
     print(f"Loading test data from {filepath}...")
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(filepath, 'rb') as f:
+        data = orjson.loads(f.read())
 
     if limit:
         data = data[:limit]
@@ -39,7 +45,13 @@ def load_test_data(filepath: str, limit: int = None) -> List[Dict]:
     return data
 
 
-def translate_via_api(text: str, source_lang: str, target_lang: str, api_url: str) -> Tuple[str, float]:
+async def translate_via_api(
+    client: httpx.AsyncClient,
+    text: str,
+    source_lang: str,
+    target_lang: str,
+    api_url: str
+) -> Tuple[str, float]:
     """
     Translate text using the API.
 
@@ -49,14 +61,13 @@ def translate_via_api(text: str, source_lang: str, target_lang: str, api_url: st
     start_time = time.time()
 
     try:
-        response = requests.post(
+        response = await client.post(
             api_url,
             json={
                 "text": text,
                 "source_language": source_lang,
                 "target_language": target_lang
-            },
-            timeout=60
+            }
         )
         response.raise_for_status()
         result = response.json()
@@ -69,49 +80,222 @@ def translate_via_api(text: str, source_lang: str, target_lang: str, api_url: st
         return "", -1
 
 
+async def translate_batch_via_api(
+    client: httpx.AsyncClient,
+    samples: List[Dict],
+    api_url: str
+) -> List[Tuple[str, float]]:
+    """
+    Translate a chunk of samples with a single batch API request.
+
+    Returns:
+        List of (translated_text, time_taken_seconds), one per sample. The request
+        latency is split evenly across the samples in the chunk.
+    """
+    start_time = time.time()
+
+    try:
+        response = await client.post(
+            api_url,
+            json={
+                "items": [
+                    {
+                        "text": sample["text_data"],
+                        "source_language": sample.get("source_language_code", "bn"),
+                        "target_language": sample.get("target_language_code", "en")
+                    }
+                    for sample in samples
+                ]
+            },
+            timeout=60 * len(samples)
+        )
+        response.raise_for_status()
+        items = response.json()["items"]
+        # Results are matched to references by position, so a short/long reply poisons the whole chunk
+        if len(items) != len(samples):
+            print(f"API Error: expected {len(samples)} items, got {len(items)}")
+            return [("", -1)] * len(samples)
+
+        elapsed = (time.time() - start_time) / len(items)
+        results = []
+        for item in items:
+            if item.get("error"):
+                print(f"API Error: {item['error']}")
+                results.append(("", -1))
+            else:
+                results.append((item.get("translated_text", ""), elapsed))
+        return results
+
+    except Exception as e:
+        print(f"API Error: {e}")
+        return [("", -1)] * len(samples)
+
+
+def sentence_statistics(bleu: BLEU, hypotheses: List[str], references: List[str]) -> List[List[int]]:
+    """
+    Compute per-sentence BLEU sufficient statistics.
+
+    Uses sacrebleu's own corpus statistics pass, which tokenizes and n-gram
+    counts every reference once (its reference cache) and every hypothesis
+    once, instead of once per sentence_score/corpus_score call.
+
+    Returns:
+        One row per sentence: [hyp_len, ref_len, correct_1..N, total_1..N]
+    """
+    # One reference stream, so the outer (num_refs) dimension has a single entry
+    return bleu._extract_corpus_statistics(hypotheses, [references])
+
+
+def tensor_bleu_statistics(
+    bleu: BLEU,
+    hypotheses: List[str],
+    references: List[str],
+    device: str = "cuda"
+) -> "torch.Tensor":
+    """
+    Compute per-sentence BLEU sufficient statistics on the GPU (TensorBLEU-style).
+
+    Sentences are tokenized with the BLEU instance's tokenizer and words mapped to
+    integer ids, so the statistics match sentence_statistics exactly. For each order n,
+    all hypothesis and reference n-grams are extracted with unfold and given compact
+    ids with torch.unique; per-sentence counts come from a second torch.unique over
+    (sentence, n-gram) keys, so memory stays linear in the number of n-grams.
+
+    Returns:
+        Tensor of shape (num_sentences, 2 + 2 * max_order) with rows
+        [hyp_len, ref_len, correct_1..N, total_1..N]
+    """
+    # Imported lazily so a CPU-only run never creates a CUDA context
+    import torch
+
+    max_order = bleu.max_ngram_order
+    num_sentences = len(hypotheses)
+
+    vocab = {}
+    def to_ids(sentences: List[str]) -> Tuple["torch.Tensor", "torch.Tensor"]:
+        token_ids = [
+            [vocab.setdefault(token, len(vocab)) for token in bleu._preprocess_segment(sentence).split()]
+            for sentence in sentences
+        ]
+        lengths = torch.tensor([len(ids) for ids in token_ids], dtype=torch.long)
+        padded = torch.full((len(token_ids), max(lengths.max().item(), max_order) if token_ids else max_order), -1, dtype=torch.long)
+        for row, ids in enumerate(token_ids):
+            padded[row, :len(ids)] = torch.tensor(ids, dtype=torch.long)
+        return padded.to(device), lengths.to(device)
+
+    hyp_ids, hyp_lens = to_ids(hypotheses)
+    ref_ids, ref_lens = to_ids(references)
+    sentence_idx = torch.arange(num_sentences, device=device)
+
+    def ngrams(ids: "torch.Tensor", lengths: "torch.Tensor", n: int) -> Tuple["torch.Tensor", "torch.Tensor"]:
+        """Valid n-grams of every sentence, flattened, with the sentence each came from"""
+        windows = ids.unfold(1, n, 1)  # (num_sentences, num_windows, n)
+        positions = torch.arange(windows.shape[1], device=device)
+        valid = positions.unsqueeze(0) <= (lengths - n).unsqueeze(1)
+        return windows[valid], sentence_idx.unsqueeze(1).expand_as(valid)[valid]
+
+    correct = torch.zeros((num_sentences, max_order), dtype=torch.long, device=device)
+    total = torch.zeros((num_sentences, max_order), dtype=torch.long, device=device)
+
+    for n in range(1, max_order + 1):
+        hyp_ngrams, hyp_sentences = ngrams(hyp_ids, hyp_lens, n)
+        ref_ngrams, ref_sentences = ngrams(ref_ids, ref_lens, n)
+        if hyp_ngrams.shape[0] == 0:
+            continue
+
+        # Compact n-gram ids shared by hypotheses and references
+        _, ngram_ids = torch.unique(torch.cat([hyp_ngrams, ref_ngrams]), dim=0, return_inverse=True)
+        num_ngrams = int(ngram_ids.max().item()) + 1
+        hyp_keys = hyp_sentences * num_ngrams + ngram_ids[:hyp_ngrams.shape[0]]
+        ref_keys = ref_sentences * num_ngrams + ngram_ids[hyp_ngrams.shape[0]:]
+
+        # Per-sentence n-gram counts, as sorted (sentence, n-gram) keys
+        hyp_keys, hyp_counts = torch.unique(hyp_keys, return_counts=True)
+        ref_keys, ref_counts = torch.unique(ref_keys, return_counts=True)
+
+        # Look up each hypothesis n-gram's reference count (0 if absent) and clip
+        if ref_keys.shape[0] > 0:
+            position = torch.searchsorted(ref_keys, hyp_keys).clamp(max=ref_keys.shape[0] - 1)
+            matched_counts = torch.where(ref_keys[position] == hyp_keys, ref_counts[position], torch.zeros_like(hyp_counts))
+        else:
+            matched_counts = torch.zeros_like(hyp_counts)
+        clipped = torch.minimum(hyp_counts, matched_counts)
+
+        correct[:, n - 1].index_add_(0, hyp_keys // num_ngrams, clipped)
+        total[:, n - 1].index_add_(0, hyp_keys // num_ngrams, hyp_counts)
+
+    return torch.cat([hyp_lens.unsqueeze(1), ref_lens.unsqueeze(1), correct, total], dim=1)
+
+
 def calculate_bleu_scores(
     hypotheses: List[str],
-    references: List[str]
-) -> Dict[str, float]:
+    references: List[str],
+    do_sentence: bool = False,
+    use_gpu: bool = False
+) -> Dict[str, Optional[float]]:
     """
     Calculate BLEU scores using sacrebleu.
 
+    Sentence and corpus scores are derived from the same per-sentence statistics:
+    corpus BLEU is computed from their column sums, which is what
+    BLEU.corpus_score does internally.
+
     Args:
         hypotheses: List of translation outputs (from API)
         references: List of reference translations (validated_text)
+        do_sentence: If True, also score every sentence. Otherwise the
+            sentence-level keys are None
+        use_gpu: If True, count the statistics on the GPU with torch (requires CUDA)
 
     Returns:
         Dictionary with BLEU score and related metrics
     """
     bleu = BLEU()
 
-    # sacrebleu expects references as list of lists (for multiple references per hypothesis)
-    refs = [[ref] for ref in references]
+    if use_gpu and hypotheses:
+        stats = tensor_bleu_statistics(bleu, hypotheses, references).tolist()
+    else:
+        stats = sentence_statistics(bleu, hypotheses, references)
 
     # Calculate corpus-level BLEU
-    score = bleu.corpus_score(hypotheses, list(zip(*refs)))
+    stats_array = np.asarray(stats, dtype=np.int64).reshape(-1, 2 + 2 * bleu.max_ngram_order)
+    score = bleu._compute_score_from_stats(stats_array.sum(axis=0).tolist())
 
-    # Calculate sentence-level BLEU scores
-    sentence_scores = []
-    for hyp, ref in zip(hypotheses, references):
-        sent_score = bleu.sentence_score(hyp, [ref])
-        sentence_scores.append(sent_score.score)
-
-    return {
+    results = {
         "corpus_bleu": score.score,
         "corpus_bleu_bp": score.bp,  # Brevity penalty
-        "sentence_bleu_mean": mean(sentence_scores) if sentence_scores else 0,
-        "sentence_bleu_std": stdev(sentence_scores) if len(sentence_scores) > 1 else 0,
-        "sentence_bleu_min": min(sentence_scores) if sentence_scores else 0,
-        "sentence_bleu_max": max(sentence_scores) if sentence_scores else 0,
-        "sentence_scores": sentence_scores
+        "sentence_bleu_mean": None,
+        "sentence_bleu_std": None,
+        "sentence_bleu_min": None,
+        "sentence_bleu_max": None,
+        "sentence_scores": None
     }
+    if not do_sentence:
+        return results
 
+    # Calculate sentence-level BLEU scores
+    sentence_scores = [bleu._compute_score_from_stats(row).score for row in stats]
+    scores = np.asarray(sentence_scores, dtype=np.float64)
+
+    results.update({
+        "sentence_bleu_mean": float(scores.mean()) if scores.size else 0,
+        "sentence_bleu_std": float(scores.std(ddof=1)) if scores.size > 1 else 0,
+        "sentence_bleu_min": float(scores.min()) if scores.size else 0,
+        "sentence_bleu_max": float(scores.max()) if scores.size else 0,
+        "sentence_scores": sentence_scores
+    })
+    return results
 
-def run_evaluation(
+
+async def run_evaluation(
     test_data: List[Dict],
     api_url: str = "http://localhost:9000/translate",
-    use_api: bool = True
+    use_api: bool = True,
+    concurrency: int = 32,
+    batch_api_url: Optional[str] = None,
+    batch_size: int = 32,
+    sentence_bleu: bool = False,
+    gpu_bleu: bool = False
 ) -> Dict:
     """
     Run BLEU evaluation on test data.
@@ -120,6 +304,11 @@ def run_evaluation(
         test_data: List of test samples with text_data and validated_text
         api_url: Translation API endpoint
         use_api: If True, translate via API. If False, use dummy translations for testing
+        concurrency: Maximum number of API requests in flight at once
+        batch_api_url: Batch translation API endpoint (default: api_url + "_batch")
+        batch_size: Samples per batch request (1 sends one /translate request per sample)
+        sentence_bleu: If True, also compute sentence-level BLEU statistics
+        gpu_bleu: If True, count BLEU statistics on the GPU
 
     Returns:
         Dictionary with evaluation results
@@ -127,6 +316,7 @@ def run_evaluation(
     hypotheses = []
     references = []
     translation_times = []
+    wall_clock = 0.0
     errors = 0
 
     total = len(test_data)
@@ -134,32 +324,54 @@ def run_evaluation(
     print(f"Starting evaluation of {total} samples...")
     print(f"{'='*70}\n")
 
-    for idx, sample in enumerate(test_data, 1):
-        text = sample["text_data"]
-        reference = sample["validated_text"]
-        source_lang = sample.get("source_language_code", "bn")
-        target_lang = sample.get("target_language_code", "en")
-
-        if use_api:
-            # Translate using API
-            hypothesis, elapsed = translate_via_api(text, source_lang, target_lang, api_url)
-
+    if use_api:
+        if batch_api_url is None:
+            batch_api_url = api_url + "_batch"
+        semaphore = asyncio.Semaphore(concurrency)
+        completed = 0
+        limits = httpx.Limits(max_keepalive_connections=concurrency, max_connections=concurrency * 2)
+
+        async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+            async def bounded(chunk: List[Dict]) -> List[Tuple[str, float]]:
+                nonlocal completed
+                async with semaphore:
+                    if batch_size > 1:
+                        results = await translate_batch_via_api(client, chunk, batch_api_url)
+                    else:
+                        sample = chunk[0]
+                        results = [await translate_via_api(
+                            client,
+                            sample["text_data"],
+                            sample.get("source_language_code", "bn"),
+                            sample.get("target_language_code", "en"),
+                            api_url
+                        )]
+                completed += len(chunk)
+                if batch_size > 1 or completed % 10 == 0 or completed == 1:
+                    print(f"Progress: {completed}/{total} ({completed/total*100:.1f}%)")
+                return results
+
+            chunks = [test_data[i:i + batch_size] for i in range(0, len(test_data), batch_size)]
+
+            # gather preserves input order, so results line up with test_data
+            start_time = time.time()
+            chunk_results = await asyncio.gather(*[bounded(chunk) for chunk in chunks])
+            wall_clock = time.time() - start_time
+            results = [result for chunk in chunk_results for result in chunk]
+
+        for idx, (sample, (hypothesis, elapsed)) in enumerate(zip(test_data, results), 1):
             if hypothesis:
                 hypotheses.append(hypothesis)
-                references.append(reference)
+                references.append(sample["validated_text"])
                 translation_times.append(elapsed)
-
-                # Print progress
-                if idx % 10 == 0 or idx == 1:
-                    print(f"Progress: {idx}/{total} ({idx/total*100:.1f}%) - "
-                          f"Avg time: {mean(translation_times):.2f}s")
             else:
                 errors += 1
                 print(f"Error on sample {idx}")
-        else:
-            # For testing: just use reference as hypothesis (should give BLEU=100)
-            hypotheses.append(reference)
-            references.append(reference)
+    else:
+        # For testing: just use reference as hypothesis (should give BLEU=100)
+        for sample in test_data:
+            hypotheses.append(sample["validated_text"])
+            references.append(sample["validated_text"])
 
     print(f"\n{'='*70}")
     print(f"Translation complete: {len(hypotheses)}/{total} successful, {errors} errors")
@@ -167,20 +379,22 @@ def run_evaluation(
 
     # Calculate BLEU scores
     print("Calculating BLEU scores...")
-    bleu_results = calculate_bleu_scores(hypotheses, references)
+    bleu_results = calculate_bleu_scores(hypotheses, references, do_sentence=sentence_bleu, use_gpu=gpu_bleu)
 
     # Compile results
+    times = np.asarray(translation_times, dtype=np.float64)
     results = {
         "total_samples": total,
         "successful": len(hypotheses),
         "errors": errors,
         "bleu_scores": bleu_results,
         "translation_times": {
-            "mean": mean(translation_times) if translation_times else 0,
-            "std": stdev(translation_times) if len(translation_times) > 1 else 0,
-            "min": min(translation_times) if translation_times else 0,
-            "max": max(translation_times) if translation_times else 0,
-            "total": sum(translation_times) if translation_times else 0
+            "mean": float(times.mean()) if times.size else 0,
+            "std": float(times.std(ddof=1)) if times.size > 1 else 0,
+            "min": float(times.min()) if times.size else 0,
+            "max": float(times.max()) if times.size else 0,
+            "total": float(times.sum()) if times.size else 0,
+            "wall_clock": wall_clock
         }
     }
 
@@ -203,19 +417,21 @@ def print_results(results: Dict):
     print(f"\n🎯 BLEU Scores:")
     print(f"  Corpus BLEU:       {bleu['corpus_bleu']:.2f}")
     print(f"  Brevity Penalty:   {bleu['corpus_bleu_bp']:.4f}")
-    print(f"  Sentence BLEU (mean): {bleu['sentence_bleu_mean']:.2f}")
-    print(f"  Sentence BLEU (std):  {bleu['sentence_bleu_std']:.2f}")
-    print(f"  Sentence BLEU (min):  {bleu['sentence_bleu_min']:.2f}")
-    print(f"  Sentence BLEU (max):  {bleu['sentence_bleu_max']:.2f}")
+    if bleu['sentence_scores'] is not None:
+        print(f"  Sentence BLEU (mean): {bleu['sentence_bleu_mean']:.2f}")
+        print(f"  Sentence BLEU (std):  {bleu['sentence_bleu_std']:.2f}")
+        print(f"  Sentence BLEU (min):  {bleu['sentence_bleu_min']:.2f}")
+        print(f"  Sentence BLEU (max):  {bleu['sentence_bleu_max']:.2f}")
 
     if results['translation_times']['mean'] > 0:
         times = results['translation_times']
         print(f"\n⏱️  Translation Times:")
-        print(f"  Mean time:         {times['mean']:.3f}s")
+        print(f"  Mean time/sample:  {times['mean']:.3f}s")
         print(f"  Std deviation:     {times['std']:.3f}s")
-        print(f"  Min time:          {times['min']:.3f}s")
-        print(f"  Max time:          {times['max']:.3f}s")
-        print(f"  Total time:        {times['total']:.2f}s ({times['total']/60:.2f} min)")
+        print(f"  Min time/sample:   {times['min']:.3f}s")
+        print(f"  Max time/sample:   {times['max']:.3f}s")
+        print(f"  Summed time:       {times['total']:.2f}s ({times['total']/60:.2f} min)")
+        print(f"  Wall-clock time:   {times['wall_clock']:.2f}s ({times['wall_clock']/60:.2f} min)")
 
     print("\n" + "="*70)
 
@@ -232,9 +448,13 @@ def print_results(results: Dict):
 
 
 def save_detailed_results(results: Dict, output_file: str = "bleu_results.json"):
-    """Save detailed results to JSON file."""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    """Save detailed results to JSON file.
+
+    orjson writes floats in their shortest round-trip form, which can differ
+    textually from json.dump (e.g. 1e-05 is written as 0.00001).
+    """
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     print(f"✅ Detailed results saved to {output_file}")
 
 
@@ -258,6 +478,33 @@ def main():
         default=10,
         help="Limit number of samples to test"
     )
+    parser.add_argument(
+        "--batch-api-url",
+        default=None,
+        help="Batch translation API endpoint URL (default: --api-url with a _batch suffix)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=32,
+        help="Samples per batch request (1 disables batching)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=32,
+        help="Maximum number of concurrent API requests"
+    )
+    parser.add_argument(
+        "--sentence-bleu",
+        action="store_true",
+        help="Also compute sentence-level BLEU statistics"
+    )
+    parser.add_argument(
+        "--gpu-bleu",
+        action="store_true",
+        help="Count BLEU statistics on the GPU (requires torch with CUDA)"
+    )
     parser.add_argument(
         "--no-api",
         action="store_true",
@@ -275,11 +522,16 @@ def main():
     test_data = load_test_data(args.test_file, args.limit)
 
     # Run evaluation
-    results = run_evaluation(
+    results = asyncio.run(run_evaluation(
         test_data,
         api_url=args.api_url,
-        use_api=not args.no_api
-    )
+        use_api=not args.no_api,
+        concurrency=args.concurrency,
+        batch_api_url=args.batch_api_url,
+        batch_size=args.batch_size,
+        sentence_bleu=args.sentence_bleu,
+        gpu_bleu=args.gpu_bleu
+    ))
 
     # Print results
     print_results(results)
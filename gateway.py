@@ -0,0 +1,96 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+from typing import Optional
+import os
+import httpx
+import orjson
+import uvicorn
+
+from schemas import (
+    TranslationRequest,
+    TranslationResponse,
+    BatchTranslationRequest,
+    BatchTranslationResponse,
+)
+
+# Stateless front-end for the model server. It never imports main.py, so it can run
+# with several uvicorn workers while a single api.py process owns the GPU:
+#
+#   PORT=9001 python api.py
+#   uvicorn gateway:app --workers 4 --host 0.0.0.0 --port 9000
+MODEL_SERVER_URL = os.environ.get("MODEL_SERVER_URL", "http://127.0.0.1:9001")
+
+client: Optional[httpx.AsyncClient] = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global client
+    # Generation can take a long time, so only the connect phase is bounded
+    client = httpx.AsyncClient(
+        base_url=MODEL_SERVER_URL,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        timeout=httpx.Timeout(None, connect=5.0)
+    )
+    yield
+    await client.aclose()
+
+app = FastAPI(
+    title="Translation API Gateway",
+    description="Multi-worker front-end that forwards translation requests to the model server",
+    version="1.0.0",
+    lifespan=lifespan
+)
+
+# Configure CORS - Allow all origins for public API
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],  # Allow all origins for public deployment
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+async def forward(method: str, path: str, payload: Optional[dict] = None) -> dict:
+    """Send a request to the model server and relay its JSON body or error"""
+    try:
+        response = await client.request(method, path, json=payload)
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=502, detail=f"Model server unavailable: {str(e)}")
+
+    if response.status_code != 200:
+        try:
+            detail = response.json().get("detail", response.text)
+        except ValueError:
+            detail = response.text
+        raise HTTPException(status_code=response.status_code, detail=detail)
+
+    return orjson.loads(response.content)
+
+@app.get("/")
+async def root():
+    return {
+        "message": "Translation API is running",
+        "endpoints": {
+            "translate": "/translate (POST)",
+            "translate_batch": "/translate_batch (POST)",
+            "health": "/health (GET)"
+        }
+    }
+
+@app.get("/health")
+async def health():
+    return await forward("GET", "/health")
+
+@app.post("/translate", response_model=TranslationResponse)
+async def translate_text(request: TranslationRequest):
+    """Forward a translation request to the model server."""
+    return await forward("POST", "/translate", request.model_dump())
+
+@app.post("/translate_batch", response_model=BatchTranslationResponse)
+async def translate_batch(request: BatchTranslationRequest):
+    """Forward a batch translation request to the model server."""
+    return await forward("POST", "/translate_batch", request.model_dump())
+
+if __name__ == "__main__":
+    uvicorn.run("gateway:app", host="0.0.0.0", port=9000, workers=int(os.environ.get("WEB_CONCURRENCY", 4)))
@@ -1,8 +1,10 @@
-from transformers import AutoModelForCausalLM, AutoTokenizer
+from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig, DynamicCache, StopStringCriteria, StoppingCriteriaList
 from peft import PeftModel
 import torch
-from typing import Optional, List, Any, Mapping
+from typing import Optional, List, Any, Mapping, Tuple, Union
 
+import copy
+import importlib.util
 import json
 import json5
 import re
@@ -12,20 +14,35 @@ from pydantic import BaseModel, Field, ValidationError
 # -------------------------------
 # JSON REPAIR HELPERS
 # -------------------------------
+_ASSISTANT_RE = re.compile(r"^\s*Assistant:\s*", re.IGNORECASE)
+_PREAMBLE_RE = re.compile(r"(?s)^(?:(?:Note|Disclaimer):.*?\n)+")
+
 def clean_output(text: str) -> str:
-    text = re.sub(r"^\s*Assistant:\s*", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"(?s)^Note:.*?\n", "", text)
-    text = re.sub(r"(?s)^Disclaimer:.*?\n", "", text)
-    text = re.sub(r"(?s)^.*?(\{)", r"\1", text)
-    text = re.sub(r"(\}).*$", r"\1", text)
+    text = _ASSISTANT_RE.sub("", text)
+    text = _PREAMBLE_RE.sub("", text)
+
+    # Keep only the span from the first "{" to the last "}"
+    start = text.find("{")
+    if start != -1:
+        end = text.rfind("}")
+        text = text[start:end + 1] if end > start else text[start:]
     return text.strip()
 
+_JSON_DECODER = json.JSONDecoder()
+
 def repair_json(output: str) -> dict:
-    # Find the first JSON object by tracking braces
     start_idx = output.find('{')
     if start_idx == -1:
         raise ValueError("No JSON object found")
 
+    # Fast path: well-formed JSON is located and parsed in one pass by the C decoder
+    try:
+        obj, _ = _JSON_DECODER.raw_decode(output, start_idx)
+        return obj
+    except json.JSONDecodeError:
+        pass
+
+    # Find the first JSON object by tracking braces
     brace_count = 0
     end_idx = -1
 
@@ -90,25 +107,59 @@ def validate_output(json_obj: dict) -> TranslationOutput:
 # -------------------------------
 # MODEL CONFIGURATION
 # -------------------------------
+def default_attn_implementation() -> str:
+    """FlashAttention-2 when flash-attn is installed and a GPU is present, else PyTorch SDPA"""
+    if torch.cuda.is_available() and importlib.util.find_spec("flash_attn") is not None:
+        return "flash_attention_2"
+    return "sdpa"
+
 class TranslationModel:
     """Wrapper for HuggingFace transformers model with optional PEFT adapter support"""
-    def __init__(self, model_name: str, device: str = "cuda", adapter_path: Optional[str] = None):
+    def __init__(self, model_name: str, device: str = "cuda", adapter_path: Optional[str] = None, quantization: Optional[str] = None, prompt_prefix: Optional[str] = None, compile_model: bool = False, compile_batch_size: int = 8, attn_implementation: Optional[str] = None, draft_model_name: Optional[str] = None, num_assistant_tokens: int = 5):
         self.model_name = model_name
         self.device = device
         self.adapter_path = adapter_path
+        self.quantization = quantization
+        self.prompt_prefix = prompt_prefix
+        self.compile_model = compile_model
+        self.compile_batch_size = compile_batch_size
+        self.attn_implementation = attn_implementation or default_attn_implementation()
+        self.num_assistant_tokens = num_assistant_tokens
+
+        # HF assisted generation raises on static caches, so every single-prompt batch would fail
+        if compile_model and draft_model_name:
+            raise ValueError("Speculative decoding (draft model) is not supported together with compile_model (static KV cache)")
+
+        # StopStringCriteria precomputes token/stop-string overlap tables over the whole vocab,
+        # which takes seconds on a 150k vocab, so build one per stop list and reuse it
+        self._stop_criteria: dict = {}
 
         # Load tokenizer (from adapter if available, else base model)
         tokenizer_path = adapter_path if adapter_path else model_name
-        self.tokenizer = AutoTokenizer.from_pretrained(tokenizer_path)
+        self.tokenizer = AutoTokenizer.from_pretrained(tokenizer_path, use_fast=True)
+
+        # Left padding keeps every prompt flush against its generated tokens in a batch
+        self.tokenizer.padding_side = "left"
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
 
         # Load base model
-        print(f"Loading base model: {model_name}")
+        print(f"Loading base model: {model_name} (attention: {self.attn_implementation})")
         self.model = AutoModelForCausalLM.from_pretrained(
             model_name,
             torch_dtype=torch.float16,
-            device_map="auto"
+            device_map="auto",
+            quantization_config=self._quantization_config(quantization),
+            attn_implementation=self.attn_implementation
         )
 
+        # AWQ/GPTQ are read from the checkpoint, so a plain checkpoint would silently load in fp16
+        if quantization in ("awq", "gptq"):
+            quant_config = getattr(self.model.config, "quantization_config", None)
+            quant_method = quant_config.get("quant_method") if isinstance(quant_config, dict) else getattr(quant_config, "quant_method", None)
+            if quant_method != quantization:
+                raise ValueError(f"quantization={quantization!r} requires a pre-quantized {quantization.upper()} checkpoint, but {model_name} is not one; point BASE_MODEL at a {quantization.upper()} checkpoint")
+
         # Load PEFT adapter if provided
         if adapter_path and os.path.exists(adapter_path):
             print(f"Loading PEFT adapter from: {adapter_path}")
@@ -117,11 +168,122 @@ class TranslationModel:
 
         self.model.eval()
 
+        # Small draft model for speculative (assisted) decoding; must share the tokenizer
+        self.draft_model = None
+        if draft_model_name:
+            print(f"Loading draft model: {draft_model_name}")
+            self.draft_model = AutoModelForCausalLM.from_pretrained(
+                draft_model_name,
+                torch_dtype=torch.float16,
+                device_map="auto",
+                attn_implementation=self.attn_implementation
+            )
+            self.draft_model.eval()
+
+        # Static KV cache + compiled forward lets "reduce-overhead" capture the decode step in a CUDA graph
+        if compile_model:
+            base_model = self.model.get_base_model() if isinstance(self.model, PeftModel) else self.model
+            # Older transformers releases (Qwen2 before 4.45) flag models without static cache support
+            if not getattr(base_model, "_supports_static_cache", True):
+                raise ValueError(f"{type(base_model).__name__} does not support a static KV cache in this transformers version; upgrade transformers or unset compile_model")
+            base_model.generation_config.cache_implementation = "static"
+            base_model.forward = torch.compile(base_model.forward, mode="reduce-overhead", fullgraph=True)
+            print("✓ Model forward compiled with static KV cache")
+
+        # Prefill the shared prompt prefix once; generate_batch reuses its KV cache.
+        # Skipped when compiled: generate() can't seed a static cache from a dynamic one.
+        self.prefix_ids = None
+        self.prefix_cache = None
+        if prompt_prefix and not compile_model:
+            self.prefix_ids = self.tokenizer(prompt_prefix, return_tensors="pt", add_special_tokens=False).input_ids.to(self.device)
+            with torch.no_grad():
+                self.prefix_cache = self.model(
+                    input_ids=self.prefix_ids,
+                    past_key_values=DynamicCache(),
+                    use_cache=True
+                ).past_key_values
+            print(f"✓ Cached KV for {self.prefix_ids.shape[1]}-token prompt prefix")
+
+    @staticmethod
+    def _quantization_config(quantization: Optional[str]) -> Optional[BitsAndBytesConfig]:
+        """
+        Weight-only quantization config; activations stay in fp16.
+        "int8"/"int4" quantize on load with bitsandbytes. Pre-quantized AWQ/GPTQ
+        checkpoints carry their own config, so model_name should point at them.
+        """
+        if quantization is None or quantization in ("awq", "gptq"):
+            return None
+        if quantization == "int8":
+            return BitsAndBytesConfig(load_in_8bit=True)
+        if quantization == "int4":
+            return BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_quant_type="nf4",
+                bnb_4bit_compute_dtype=torch.float16
+            )
+        raise ValueError(f"Unsupported quantization: {quantization}")
+
+    def _encode(self, prompts: List[str], use_prefix_cache: bool = True) -> dict:
+        """
+        Tokenize prompts into left-padded generate() inputs. When every prompt starts
+        with the cached prefix, only the suffixes are tokenized and padded; the prefix
+        ids are prepended unpadded so they line up with the cached KV, and a per-batch
+        copy of the cache is passed along so generate() only prefills the suffixes.
+        """
+        if not use_prefix_cache or self.prefix_cache is None or not all(prompt.startswith(self.prompt_prefix) for prompt in prompts):
+            # Round compiled input lengths up so fewer distinct shapes trigger recompilation
+            pad_to_multiple_of = 64 if self.compile_model else None
+            return self.tokenizer(prompts, return_tensors="pt", padding=True, pad_to_multiple_of=pad_to_multiple_of).to(self.device)
+
+        suffixes = [prompt[len(self.prompt_prefix):] for prompt in prompts]
+        suffix_inputs = self.tokenizer(suffixes, return_tensors="pt", padding=True, add_special_tokens=False).to(self.device)
+
+        batch_size = len(prompts)
+        prefix_ids = self.prefix_ids.expand(batch_size, -1)
+
+        # Deep-copy so generation never writes into the shared prefix cache
+        past_key_values = copy.deepcopy(self.prefix_cache)
+        past_key_values.batch_repeat_interleave(batch_size)
+
+        return {
+            "input_ids": torch.cat([prefix_ids, suffix_inputs["input_ids"]], dim=1),
+            "attention_mask": torch.cat([torch.ones_like(prefix_ids), suffix_inputs["attention_mask"]], dim=1),
+            "past_key_values": past_key_values,
+        }
+
+    def _stop_string_criteria(self, stop: List[str]) -> StopStringCriteria:
+        """Stop-string criteria for this stop list, built on first use"""
+        key = tuple(stop)
+        if key not in self._stop_criteria:
+            self._stop_criteria[key] = StopStringCriteria(self.tokenizer, list(stop))
+        return self._stop_criteria[key]
+
     def generate(self, prompt: str, max_tokens: int = 2048, temperature: float = 0.0, stop: Optional[List[str]] = None) -> str:
         """Generate text using the model"""
-        inputs = self.tokenizer(prompt, return_tensors="pt").to(self.device)
+        return self.generate_batch([prompt], max_tokens=max_tokens, temperature=temperature, stop=stop)[0]
+
+    def generate_batch(self, prompts: List[str], max_tokens: int = 2048, temperature: float = 0.0, stop: Optional[List[str]] = None) -> List[str]:
+        """Generate text for several prompts in a single batched forward pass"""
+        # Compiled decoding records one CUDA graph and static cache per batch shape, so pad every
+        # batch to compile_batch_size with copies of the last prompt and drop their outputs below
+        num_prompts = len(prompts)
+        if self.compile_model and num_prompts < self.compile_batch_size:
+            prompts = prompts + [prompts[-1]] * (self.compile_batch_size - num_prompts)
+
+        # HF assisted generation only supports a batch size of 1 (larger batches already amortize
+        # decode steps) and doesn't resume from a pre-filled cache, so it skips the prefix cache
+        speculative = self.draft_model is not None and len(prompts) == 1
+
+        inputs = self._encode(prompts, use_prefix_cache=not speculative)
         input_length = inputs['input_ids'].shape[1]
 
+        # End each row as soon as it emits a stop string (e.g. the closing ```) instead of running to max_tokens
+        # (explicit criteria rather than stop_strings, which assisted generation can't forward to the draft model)
+        generate_kwargs = {"stopping_criteria": StoppingCriteriaList([self._stop_string_criteria(stop)])} if stop else {}
+
+        if speculative:
+            generate_kwargs.update(assistant_model=self.draft_model, num_assistant_tokens=self.num_assistant_tokens)
+
         with torch.no_grad():
             outputs = self.model.generate(
                 **inputs,
@@ -129,39 +291,83 @@ class TranslationModel:
                 temperature=temperature if temperature > 0 else 1.0,
                 do_sample=temperature > 0,
                 repetition_penalty=1.1,
-                pad_token_id=self.tokenizer.eos_token_id,
+                pad_token_id=self.tokenizer.pad_token_id,
                 eos_token_id=self.tokenizer.eos_token_id,
+                **generate_kwargs
             )
 
-        # Decode only the newly generated tokens (exclude the input prompt)
-        generated_tokens = outputs[0][input_length:]
-        generated_text = self.tokenizer.decode(generated_tokens, skip_special_tokens=True)
+        # Decode only the newly generated tokens (exclude the input prompt).
+        # Prompts are left-padded, so every row's prompt ends at input_length.
+        generated_texts = self.tokenizer.batch_decode(outputs[:, input_length:], skip_special_tokens=True)
 
-        return generated_text.strip()
+        return [generated_text.strip() for generated_text in generated_texts[:num_prompts]]
 
-# -------------------------------
-# MODEL LOADING WITH TRANSFORMERS
-# -------------------------------
-BASE_MODEL = "Babel-9B-Chat"
-ADAPTER_PATH = "final_model"  # QLoRA fine-tuned adapter
+class VLLMTranslationModel:
+    """Wrapper for a vLLM engine (PagedAttention, continuous batching) with optional LoRA adapter support"""
+    # vLLM quantization methods for each MODEL_QUANTIZATION value it supports
+    QUANTIZATION_METHODS = {"awq": "awq", "gptq": "gptq", "int4": "bitsandbytes"}
+
+    def __init__(self, model_name: str, adapter_path: Optional[str] = None, max_model_len: int = 4096, quantization: Optional[str] = None, draft_model_name: Optional[str] = None, num_assistant_tokens: int = 5):
+        # vLLM is an optional dependency, only needed for TRANSLATION_BACKEND=vllm
+        from vllm import LLM
+        from vllm.lora.request import LoRARequest
+
+        self.model_name = model_name
+        self.adapter_path = adapter_path
+        self.lora_request = None
+
+        tokenizer_path = adapter_path if adapter_path else model_name
+        engine_args = {}
 
-print("Loading model with transformers...")
+        if quantization is not None:
+            if quantization not in self.QUANTIZATION_METHODS:
+                raise ValueError(f"Unsupported quantization for vLLM backend: {quantization}")
+            engine_args["quantization"] = self.QUANTIZATION_METHODS[quantization]
 
-# Load base model with PEFT adapter
-llm = TranslationModel(
-    model_name=BASE_MODEL,
-    device="cuda" if torch.cuda.is_available() else "cpu",
-    adapter_path=ADAPTER_PATH if os.path.exists(ADAPTER_PATH) else None
-)
+        if draft_model_name:
+            engine_args["speculative_config"] = {"model": draft_model_name, "num_speculative_tokens": num_assistant_tokens}
 
-print("✓ Model loaded successfully!")
+        # Serve the PEFT adapter through vLLM's LoRA support instead of merging it
+        if adapter_path and os.path.exists(adapter_path):
+            with open(os.path.join(adapter_path, "adapter_config.json")) as f:
+                lora_rank = json.load(f).get("r", 16)
+            engine_args.update(enable_lora=True, max_lora_rank=lora_rank)
+            self.lora_request = LoRARequest("translation_adapter", 1, adapter_path)
+            print(f"Serving PEFT adapter from: {adapter_path}")
+
+        print(f"Loading base model with vLLM: {model_name}")
+        self.llm = LLM(
+            model=model_name,
+            tokenizer=tokenizer_path,
+            dtype="float16",
+            max_model_len=max_model_len,
+            enable_prefix_caching=True,  # shares KV blocks for the common prompt prefix
+            **engine_args
+        )
+
+    def generate(self, prompt: str, max_tokens: int = 2048, temperature: float = 0.0, stop: Optional[List[str]] = None) -> str:
+        """Generate text using the model"""
+        return self.generate_batch([prompt], max_tokens=max_tokens, temperature=temperature, stop=stop)[0]
+
+    def generate_batch(self, prompts: List[str], max_tokens: int = 2048, temperature: float = 0.0, stop: Optional[List[str]] = None) -> List[str]:
+        """Generate text for several prompts; vLLM schedules them with continuous batching"""
+        from vllm import SamplingParams
+
+        sampling_params = SamplingParams(
+            temperature=temperature,
+            max_tokens=max_tokens,
+            repetition_penalty=1.1,
+            stop=stop,
+            include_stop_str_in_output=True,
+        )
+        outputs = self.llm.generate(prompts, sampling_params, lora_request=self.lora_request, use_tqdm=False)
+
+        return [output.outputs[0].text.strip() for output in outputs]
 
 # -------------------------------
 # PROMPTS (FIXED ESCAPING)
 # -------------------------------
-def build_prompt(text: str, src_lang: str, tgt_lang: str) -> str:
-    """Build the translation prompt"""
-    system_prompt = """You are a professional translation engine. Follow these rules STRICTLY:
+SYSTEM_PROMPT = """You are a professional translation engine. Follow these rules STRICTLY:
 
 1. Translate EXACTLY what is written - do NOT add words, context, or interpretations
 2. Provide LITERAL, word-for-word translation only
@@ -179,7 +385,7 @@ Schema:
 
 CRITICAL: The translated_text must contain ONLY the direct translation. No extra words."""
 
-    few_shot_example = """Translate from Bangla to English.
+FEW_SHOT_EXAMPLE = """Translate from Bangla to English.
 
 IMPORTANT: Provide a HUMANLIKE, DIRECT translation. Do NOT add any words or context not present in the original text.
 
@@ -194,6 +400,24 @@ Output ONLY this JSON:
 }
 ```"""
 
+# Static part of every prompt (system + few-shot turn), identical across requests.
+# Backends reuse its KV cache so only the per-request suffix is prefilled.
+PROMPT_PREFIX = f"""<|im_start|>system
+{SYSTEM_PROMPT}<|im_end|>
+<|im_start|>user
+{FEW_SHOT_EXAMPLE}<|im_end|>
+<|im_start|>assistant
+```json
+{{
+  "original_text": "আমি ভাত খাই",
+  "translated_text": "I eat rice"
+}}
+```<|im_end|>
+<|im_start|>user
+"""
+
+def build_prompt_suffix(text: str, src_lang: str, tgt_lang: str) -> str:
+    """Build the request-specific part of the prompt that follows PROMPT_PREFIX"""
     user_prompt = f"""Translate the following text from {src_lang} to {tgt_lang}.
 
 IMPORTANT: Provide a HUMANLIKE, DIRECT translation. Do NOT add any words or context not present in the original text.
@@ -209,46 +433,92 @@ Output ONLY this JSON:
 }}
 ```"""
 
-    # Combine into a single prompt
-    full_prompt = f"""<|im_start|>system
-{system_prompt}<|im_end|>
-<|im_start|>user
-{few_shot_example}<|im_end|>
-<|im_start|>assistant
-```json
-{{
-  "original_text": "আমি ভাত খাই",
-  "translated_text": "I eat rice"
-}}
-```<|im_end|>
-<|im_start|>user
-{user_prompt}<|im_end|>
+    return f"""{user_prompt}<|im_end|>
 <|im_start|>assistant
 """
 
-    return full_prompt
+def build_prompt(text: str, src_lang: str, tgt_lang: str) -> str:
+    """Build the translation prompt"""
+    return PROMPT_PREFIX + build_prompt_suffix(text, src_lang, tgt_lang)
+
+# -------------------------------
+# MODEL LOADING
+# -------------------------------
+BASE_MODEL = os.environ.get("BASE_MODEL", "Babel-9B-Chat")  # point at e.g. an AWQ checkpoint for awq/gptq
+ADAPTER_PATH = "final_model"  # QLoRA fine-tuned adapter
+BACKEND = os.environ.get("TRANSLATION_BACKEND", "transformers")  # "transformers" or "vllm"
+QUANTIZATION = os.environ.get("MODEL_QUANTIZATION") or None  # None, "int8", "int4", "awq" or "gptq"
+COMPILE_MODEL = os.environ.get("COMPILE_MODEL", "0") == "1"  # torch.compile + static KV cache (transformers only)
+ATTN_IMPLEMENTATION = os.environ.get("ATTN_IMPLEMENTATION") or None  # None picks flash_attention_2 or sdpa
+DRAFT_MODEL = os.environ.get("DRAFT_MODEL") or None  # small same-tokenizer model for speculative decoding
+MAX_BATCH_SIZE = 8  # most prompts per generate call; the API batcher and compiled batch padding both use it
+
+def load_model() -> Union[TranslationModel, VLLMTranslationModel]:
+    """
+    Load the configured backend. Called once per server process (see the FastAPI
+    lifespan in api.py) rather than at import, so importing this module is cheap.
+    """
+    if BACKEND == "vllm":
+        print("Loading model with vLLM...")
+
+        llm = VLLMTranslationModel(
+            model_name=BASE_MODEL,
+            adapter_path=ADAPTER_PATH if os.path.exists(ADAPTER_PATH) else None,
+            quantization=QUANTIZATION,
+            draft_model_name=DRAFT_MODEL
+        )
+    else:
+        print("Loading model with transformers...")
+
+        # Load base model with PEFT adapter
+        llm = TranslationModel(
+            model_name=BASE_MODEL,
+            device="cuda" if torch.cuda.is_available() else "cpu",
+            adapter_path=ADAPTER_PATH if os.path.exists(ADAPTER_PATH) else None,
+            quantization=QUANTIZATION,
+            prompt_prefix=PROMPT_PREFIX,
+            compile_model=COMPILE_MODEL,
+            compile_batch_size=MAX_BATCH_SIZE,
+            attn_implementation=ATTN_IMPLEMENTATION,
+            draft_model_name=DRAFT_MODEL
+        )
+
+    print("✓ Model loaded successfully!")
+    return llm
 
 # -------------------------------
 # TRANSLATION FUNCTION
 # -------------------------------
-def translate(text: str, src_lang: str, tgt_lang: str) -> TranslationOutput:
+STOP_SEQUENCES = ["```\n", "```\n\n", "<|im_end|>", "\n\nTranslate", "}\n```"]
+
+def generate_translations(llm: Union[TranslationModel, VLLMTranslationModel], batch: List[Tuple[str, str, str]]) -> List[str]:
     """
-    Translate text from source language to target language.
-    Uses strict prompting to minimize hallucination.
+    Run one batched generation for a list of (text, src_lang, tgt_lang) items.
+    Returns the raw model output for each item, in order.
     """
-    prompt = build_prompt(text, src_lang, tgt_lang)
+    prompts = [build_prompt(text, src_lang, tgt_lang) for text, src_lang, tgt_lang in batch]
 
-    raw = llm.generate(
-        prompt=prompt,
+    return llm.generate_batch(
+        prompts=prompts,
         max_tokens=2048,
         temperature=0.0,
-        stop=["```\n", "```\n\n", "<|im_end|>", "\n\nTranslate", "}\n```"]
+        stop=STOP_SEQUENCES
     )
 
+def parse_translation(raw: str) -> TranslationOutput:
+    """Turn raw model output into a validated TranslationOutput"""
     step1 = clean_output(raw)
     step2 = repair_json(step1)
     return validate_output(step2)
 
+def translate(llm: Union[TranslationModel, VLLMTranslationModel], text: str, src_lang: str, tgt_lang: str) -> TranslationOutput:
+    """
+    Translate text from source language to target language.
+    Uses strict prompting to minimize hallucination.
+    """
+    raw = generate_translations(llm, [(text, src_lang, tgt_lang)])[0]
+    return parse_translation(raw)
+
 # -------------------------------
 # DEMO
 # -------------------------------
@@ -257,7 +527,9 @@ if __name__ == "__main__":
     test_cases = [
         ("The Bishop of Ramsbury was an episcopal title used by medieval English-Catholic diocesan bishops in the Anglo-Saxon English church. The title takes its name from the village of Ramsbury in Wiltshire, and was first used in the 10th and 11th centuries by the Anglo-Saxon Bishops of Ramsbury. In Saxon times, Ramsbury was an important location for the Church, and several early bishops became Archbishops of Canterbury.", "English", "Bangla")
     ]
-    
+
+    llm = load_model()
+
     for text, src, tgt in test_cases:
         start_time = time.time()
         print(f"\n{'='*60}")
@@ -265,7 +537,7 @@ if __name__ == "__main__":
         print(f"Direction: {src} → {tgt}")
         print('='*60)
 
-        result = translate(text, src, tgt)
+        result = translate(llm, text, src, tgt)
         print(f"Output: {result.translated_text}")
         print(f"JSON: {result.model_dump()}")
         print(f"Time taken: {time.time() - start_time:.2f} seconds")
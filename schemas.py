@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+from typing import Optional, List
+
+# Request/response models shared by the model server (api.py) and the gateway (gateway.py)
+
+class TranslationRequest(BaseModel):
+    text: str
+    source_language: str
+    target_language: str
+
+class TranslationResponse(BaseModel):
+    original_text: str
+    translated_text: str
+    source_language: str
+    target_language: str
+
+class BatchTranslationRequest(BaseModel):
+    items: List[TranslationRequest]
+
+class BatchTranslationResult(TranslationResponse):
+    error: Optional[str] = None
+
+class BatchTranslationResponse(BaseModel):
+    items: List[BatchTranslationResult]